@@ -0,0 +1,37 @@
+from django import forms
+from .models import Post, Tag
+
+class PostForm(forms.ModelForm):
+    # Tags are entered comma-separated and resolved to Tag rows on save
+    tag_input = forms.CharField(
+        required=False,
+        widget=forms.TextInput(attrs={
+            'placeholder': 'django, python, webdev, tutorial',
+            'class': 'form-control'
+        })
+    )
+
+    class Meta:
+        model = Post
+        fields = ['title', 'content', 'image']
+
+    def __init__(self, *args, **kwargs):
+        """Initialize form and populate tag field if editing."""
+        super().__init__(*args, **kwargs)
+        if self.instance.pk:
+            self.fields['tag_input'].initial = ', '.join(
+                self.instance.tags.values_list('name', flat=True)
+            )
+
+    def save(self, commit=True):
+        """Save post and resolve its tags by name"""
+        instance = super().save(commit=commit)
+        if commit:
+            names = dict.fromkeys(
+                name.strip().lower()
+                for name in self.cleaned_data.get('tag_input', '').split(',')
+                if name.strip()
+            )
+            # A post has a handful of tags: one get_or_create each is fine
+            instance.tags.set([Tag.objects.get_or_create(name=name)[0] for name in names])
+        return instance
@@ -0,0 +1,53 @@
+from django.db import migrations
+from django.utils.text import slugify
+
+
+def unique_slug(Tag, name):
+    """Same as Tag.unique_slug(), which historical models don't have"""
+    base = slugify(name)[:45] or 'tag'
+    slug, n = base, 1
+    while Tag.objects.filter(slug=slug).exists():
+        n += 1
+        slug = f'{base}-{n}'
+    return slug
+
+
+def split_csv_tags(apps, schema_editor):
+    """Copy the comma-separated tags into the Tag relation"""
+    Post = apps.get_model('blog', 'Post')
+    Tag = apps.get_model('blog', 'Tag')
+
+    for post in Post.objects.exclude(tags_csv=''):
+        names = dict.fromkeys(
+            name.strip().lower()[:50]
+            for name in post.tags_csv.split(',')
+            if name.strip()
+        )
+        tags = []
+        for name in names:
+            tag = Tag.objects.filter(name__iexact=name).first()
+            if tag is None:
+                # 'c' and 'c++' (or two non-ASCII names) share a slugify() result
+                tag = Tag.objects.create(name=name, slug=unique_slug(Tag, name))
+            tags.append(tag)
+        post.tags.add(*tags)
+
+
+def join_csv_tags(apps, schema_editor):
+    """Reverse: write the related tag names back as CSV"""
+    Post = apps.get_model('blog', 'Post')
+
+    for post in Post.objects.prefetch_related('tags'):
+        post.tags_csv = ','.join(tag.name for tag in post.tags.all())[:200]
+        post.save(update_fields=['tags_csv'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0002_post_tags_m2m'),
+    ]
+
+    operations = [
+        migrations.RunPython(split_csv_tags, join_csv_tags),
+    ]
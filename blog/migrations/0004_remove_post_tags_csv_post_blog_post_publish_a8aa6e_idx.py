@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-15 06:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0003_split_post_tags'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='post',
+            name='tags_csv',
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-published_date', 'author'], name='blog_post_publish_a8aa6e_idx'),
+        ),
+    ]
@@ -2,19 +2,50 @@ from django.db import models
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.text import slugify
 
 # Create your models here.
 
+class Tag(models.Model):
+    """Post topic (kept apart from the vocab app's word tags)"""
+    name = models.CharField(max_length=50, unique=True)
+    slug = models.SlugField(max_length=50, unique=True, blank=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def unique_slug(cls, name):
+        """Slug not yet taken ('c' next to 'c++' becomes 'c-2');
+        names with no ASCII slug fall back to 'tag'"""
+        base = slugify(name)[:45] or 'tag'
+        slug, n = base, 1
+        while cls.objects.filter(slug=slug).exists():
+            n += 1
+            slug = f'{base}-{n}'
+        return slug
+
+    def save(self, *args, **kwargs):
+        if not self.slug:
+            self.slug = self.unique_slug(self.name)
+        super().save(*args, **kwargs)
+
 class Post(models.Model):
     title = models.CharField(max_length=200)
     content = models.TextField()
     published_date = models.DateTimeField(default=timezone.now)
     author = models.ForeignKey(User, on_delete=models.CASCADE)
-    tags = models.CharField(max_length=200, blank=True)    # eg "python,django,web"
+    tags = models.ManyToManyField(Tag, blank=True, related_name='posts')    # eg python, django, web
     image = models.ImageField(upload_to='post_images/', blank=True, null=True)
 
     class Meta:
         ordering = ['-published_date']    # newest first
+        indexes = [
+            models.Index(fields=['-published_date', 'author']),    # matches default ordering
+        ]
 
     def __str__(self):
         return self.title
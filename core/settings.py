@@ -134,4 +134,29 @@ STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATICFILES_DIRS = [os.path.join(BASE_DIR, 'core/static')]
 
+# Cache. Set REDIS_URL in production so every worker shares cached pages
+# and content-version bumps; the per-process default only suits development.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Buffer vocab view counts in the cache and write them with
+# `python manage.py flush_view_counts` (run periodically, e.g. cron).
+# Only enable with a cache shared by all workers (Redis/Memcached).
+VOCAB_BUFFER_VIEW_COUNTS = False
 
+# Uploads over 1mb (most audio) stream to a temp file in 64kb chunks
+# instead of being held in memory. If the temp dir is on the same disk as
+# MEDIA_ROOT, saving the file is a rename rather than a second copy.
+FILE_UPLOAD_MAX_MEMORY_SIZE = 1 * 1024 * 1024
+FILE_UPLOAD_TEMP_DIR = os.environ.get('FILE_UPLOAD_TEMP_DIR') or None
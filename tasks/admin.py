@@ -5,6 +5,6 @@ from .models import Task
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
     list_display = ('title', 'user', 'priority', 'completed', 'due_date', 'created_at')
-    list_filter = ('priority', 'completed', 'user')
+    list_filter = ('priority', 'completed')
     search_fields = ('title',)
 
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-15 06:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'order'], name='tasks_task_user_id_f9a8c5_idx'),
+        ),
+    ]
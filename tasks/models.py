@@ -25,6 +25,9 @@ class Task(models.Model):
 
     class Meta:
         ordering = ['order', '-created_at']
+        indexes = [
+            models.Index(fields=['user', 'order']),
+        ]
 
     def __str__(self):
         return self.title
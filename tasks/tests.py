@@ -1,3 +1,50 @@
-from django.test import TestCase
+import json
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import include, path, reverse
+
+from .models import Task
+
+# tasks.urls isn't mounted in core.urls yet
+urlpatterns = [path('tasks/', include('tasks.urls'))]
+
+@override_settings(ROOT_URLCONF='tasks.tests')
+class TaskReorderTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('tasker', password='pass')
+        self.client.force_login(self.user)
+
+    def reorder(self, tasks):
+        return self.client.post(
+            reverse('task-reorder'),
+            json.dumps({'order': [task.pk for task in tasks]}),
+            content_type='application/json'
+        )
+
+    def listed(self):
+        """Tasks in TaskListView's order"""
+        return list(Task.objects.filter(user=self.user).order_by('order', '-id'))
+
+    def test_reorders_tasks_with_distinct_orders(self):
+        a, b, c = (Task.objects.create(user=self.user, title=t, order=i) for i, t in enumerate('abc'))
+        self.reorder([c, a, b])
+        self.assertEqual(self.listed(), [c, a, b])
+
+    def test_reorders_tied_tasks(self):
+        # All at order=0: listed newest first
+        a, b, c = (Task.objects.create(user=self.user, title=t) for t in 'abc')
+        later = Task.objects.create(user=self.user, title='later', order=5)
+        self.assertEqual(self.listed(), [c, b, a, later])
+
+        self.assertEqual(self.reorder([a, b, c]).status_code, 200)
+        self.assertEqual(self.listed(), [a, b, c, later])
+        orders = list(Task.objects.order_by('order').values_list('order', flat=True))
+        self.assertEqual(len(set(orders)), len(orders))
+
+    def test_reorder_tied_page_keeps_other_tasks_in_place(self):
+        first = Task.objects.create(user=self.user, title='first', order=-1)
+        a, b = (Task.objects.create(user=self.user, title=t) for t in 'ab')
+        last = Task.objects.create(user=self.user, title='last', order=3)
+        self.reorder([a, b])
+        self.assertEqual(self.listed(), [first, a, b, last])
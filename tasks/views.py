@@ -3,7 +3,8 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import get_object_or_404
 from django.http import JsonResponse
 from django.urls import reverse_lazy
-from django.db import models  # ← ADDED THIS FOR Max, Case, When
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
 import json
 
 from .models import Task
@@ -11,9 +12,29 @@ from .models import Task
 class TaskListView(LoginRequiredMixin, ListView):
     template_name = 'tasks/task_list.html'
     context_object_name = 'tasks'
+    paginate_by = 50
 
     def get_queryset(self):
-        return Task.objects.filter(user=self.request.user)
+        # (order, -id) is a total order: many tasks share order=0, so the
+        # keyset cursor needs the id as a tie-breaker (newest first within a tie)
+        queryset = Task.objects.filter(user=self.request.user).order_by('order', '-id')
+        # Keyset pagination: ?after=<order>&after_id=<id> seeks via the (user, order) index instead of OFFSET
+        after = self.request.GET.get('after', '')
+        after_id = self.request.GET.get('after_id', '')
+        if after.lstrip('-').isdigit() and after_id.isdigit():
+            queryset = queryset.filter(
+                models.Q(order__gt=int(after)) |
+                models.Q(order=int(after), id__lt=int(after_id))
+            )
+        return queryset
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if context['page_obj'].has_next():
+            last = list(context['tasks'])[-1]
+            context['next_after'] = last.order
+            context['next_after_id'] = last.pk
+        return context
 
 class TaskCreateView(LoginRequiredMixin, CreateView):
     model = Task
@@ -23,8 +44,11 @@ class TaskCreateView(LoginRequiredMixin, CreateView):
 
     def form_valid(self, form):
         form.instance.user = self.request.user
-        max_order = Task.objects.filter(user=self.request.user).aggregate(models.Max('order'))['order__max']
-        form.instance.order = (max_order or -1) + 1
+        # Next position is computed inside the INSERT (one round trip)
+        max_order = Task.objects.filter(user=self.request.user).order_by().values('user').annotate(
+            m=models.Max('order')
+        ).values('m')
+        form.instance.order = Coalesce(models.Subquery(max_order), models.Value(-1)) + 1
         return super().form_valid(form)
 
 class TaskToggleView(LoginRequiredMixin, View):
@@ -44,9 +68,27 @@ class TaskReorderView(LoginRequiredMixin, View):
     def post(self, request):
         data = json.loads(request.body)
         order = data.get('order', [])
-        Task.objects.filter(user=request.user, id__in=order).update(order=models.Case(
-            *[models.When(id=id, then=pos) for pos, id in enumerate(order)],
-            default='order',
-            output_field=models.IntegerField()
-        ))
+        pos_map = {int(task_id): pos for pos, task_id in enumerate(order)}
+        with transaction.atomic():
+            tasks = list(Task.objects.filter(user=request.user, id__in=pos_map).only('id', 'order'))
+            slots = sorted(task.order for task in tasks)
+            tasks.sort(key=lambda task: pos_map[task.id])
+            if len(set(slots)) == len(slots):
+                # Reuse the order values these tasks already hold, so reordering one page doesn't clash with others
+                for task, slot in zip(tasks, slots):
+                    task.order = slot
+            else:
+                # Tied values (new tasks all start at 0) can't express a new order:
+                # renumber the whole list 0..N-1, the submitted tasks taking their requested order
+                old_orders = {}
+                moved = iter(tasks)
+                tasks = []
+                for task in Task.objects.filter(user=request.user).order_by('order', '-id').only('id', 'order'):
+                    if task.id in pos_map:
+                        task = next(moved)
+                    old_orders[task.id] = task.order
+                    task.order = len(tasks)
+                    tasks.append(task)
+                tasks = [task for task in tasks if task.order != old_orders[task.id]]
+            Task.objects.bulk_update(tasks, ['order'], batch_size=500)
         return JsonResponse({'status': 'success'})
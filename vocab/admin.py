@@ -1,11 +1,59 @@
 from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
 from django.utils.html import format_html
 from django.urls import reverse
-from django.utils.safestring import mark_safe
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Count, Prefetch, Q
+from django.db.models.functions import Substr
 from django.contrib import messages
 from django.utils import timezone
-from .models import Vocab, Category, Tag, Comment, LearningProgress
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from .models import Vocab, Category, Tag, Comment, LearningProgress, delete_stored_files
+from .paginators import EstimatedCountPaginator
+from .caching import bump_content_version
+
+# ===============================
+# BADGES (rendered once at import)
+# ===============================
+
+ACCENT_COLOR = '#8b5cf6'  # Purple
+DEFAULT_BADGE_COLOR = '#6b7280'  # Gray
+
+LANGUAGE_COLORS = {
+    'kikuyu': ACCENT_COLOR,
+    'english': '#3b82f6',  # Blue
+    'swahili': '#10b981',  # Green
+}
+
+STATUS_COLORS = {
+    'pending': ('#f59e0b', '⏳ Pending'),
+    'approved': ('#10b981', '✅ Approved'),
+    'rejected': ('#ef4444', '❌ Rejected'),
+}
+
+LANGUAGE_BADGE_TEMPLATE = (
+    '<span style="background: {}; color: white; padding: 3px 8px; '
+    'border-radius: 4px; font-size: 11px; font-weight: 600; '
+    'text-transform: uppercase;">{}</span>'
+)
+
+STATUS_BADGE_TEMPLATE = (
+    '<span style="background: {}; color: white; padding: 4px 10px; '
+    'border-radius: 4px; font-size: 11px; font-weight: 600; '
+    'text-transform: uppercase;">{}</span>'
+)
+
+# Colors and labels are fixed choices, so the full HTML can be built once
+LANGUAGE_BADGES = {
+    code: format_html(LANGUAGE_BADGE_TEMPLATE, LANGUAGE_COLORS.get(code, DEFAULT_BADGE_COLOR), label)
+    for code, label in Vocab.LANGUAGE_CHOICES
+}
+
+STATUS_BADGES = {
+    status: format_html(STATUS_BADGE_TEMPLATE, color, text)
+    for status, (color, text) in STATUS_COLORS.items()
+}
 
 # =================================
 # INLINE ADMINS (Related Objects)
@@ -19,10 +67,46 @@ class CommentInline(admin.TabularInline):
 
     fields = ['user', 'content', 'created_at', 'is_flagged']
 
+    def get_queryset(self, request):
+        """Join the comment author (shown read-only on every inline row)"""
+        return super().get_queryset(request).select_related('user')
+
     def has_add_permission(self, request, obj=None):
         """Prevent adding comments from admin (users add via frontend)"""
         return False
 
+# =============
+# LIST FILTERS
+# =============
+
+class TopContributorFilter(admin.SimpleListFilter):
+    """Filter by the most active contributors only.
+    The default 'user' filter loads every User into the sidebar."""
+    title = 'top contributor'
+    parameter_name = 'contributor'
+    max_choices = 10
+
+    cache_key = 'vocab:admin:top_contributors'
+    cache_timeout = 300  # 5 minutes
+
+    def lookups(self, request, model_admin):
+        """Cached, so repeated changelist loads don't re-run the aggregate"""
+        return cache.get_or_set(self.cache_key, self._load_choices, self.cache_timeout)
+
+    def _load_choices(self):
+        users = User.objects.annotate(
+            n=Count('vocabs')
+        ).filter(n__gt=0).order_by('-n')[:self.max_choices]
+        return [(str(u.pk), u.username) for u in users]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            if not self.value().isdigit():
+                # Hand-edited URL: the changelist shows its "?e=1" error page, not a 500
+                raise IncorrectLookupParameters(f'Invalid contributor id: {self.value()!r}')
+            return queryset.filter(user_id=self.value())
+        return queryset
+
 # ===============
 # CATEGORY ADMIN
 # ===============
@@ -46,18 +130,15 @@ class CategoryAdmin(admin.ModelAdmin):
 
     def word_count_display(self, obj):
         """Shows count of approved words in this category"""
-        count = obj.get_word_count()
-        color = '#b5cf6' if count > 0 else '#6b7280'
+        count = obj.word_count
+        color = ACCENT_COLOR if count > 0 else DEFAULT_BADGE_COLOR
         return format_html(
             '<span style="color: {}; font-weight: 600;">{} words</span>',
             color,
             count
         )
     word_count_display.short_description = 'Word Count'
-
-    class Meta:
-        verbose_name = "Category"
-        verbose_name_plural = "Categories"
+    word_count_display.admin_order_field = 'word_count'
 
 # ==========
 # TAG ADMIN
@@ -71,21 +152,31 @@ class TagAdmin(admin.ModelAdmin):
     prepopulated_fields = {'slug': ('name',)}
     readonly_fields = ['created_at']
 
+    def get_queryset(self, request):
+        """Annotate approved usage counts in one query (avoids a COUNT per row)."""
+        qs = super().get_queryset(request)
+        return qs.annotate(
+            _usage=Count('vocab_entries', filter=Q(vocab_entries__status='approved'))
+        )
+
     def usage_count(self, obj):
         """Shows how many vocab entries use this tag"""
-        count = obj.vocab_entries.filter(status='approved').count()
-        return f"{count} entries"
+        return f"{obj._usage} entries"
     usage_count.short_description = 'Used In'
+    usage_count.admin_order_field = '_usage'
 
 # ===============
 # COMMENT ADMIN
 # ===============
 
+SHORT_CONTENT_LENGTH = 60
+
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     """Moderate user comments"""
     list_display = ['vocab_link', 'user', 'short_content', 'created_at', 'is_flagged']
     list_filter = ['is_flagged', 'created_at']
+    list_select_related = ['vocab', 'user']
     search_fields = ['content', 'user__username', 'vocab__word']
     readonly_fields = ['created_at'] #*
 
@@ -97,16 +188,29 @@ class CommentAdmin(admin.ModelAdmin):
         return format_html('<a href="{}">{}</a>', url, obj.vocab.word)
     vocab_link.short_description = 'Vocab Entry'
 
+    def get_queryset(self, request):
+        """Truncate content in SQL so the full text never leaves the DB.
+        One extra character tells us whether to add the ellipsis."""
+        qs = super().get_queryset(request)
+        return qs.annotate(
+            _short=Substr('content', 1, SHORT_CONTENT_LENGTH + 1)
+        ).defer('content')
+
     def short_content(self, obj):
         """Truncated comment preview"""
-        return obj.get_short_content(60)
+        short = getattr(obj, '_short', None)
+        if short is None:
+            return obj.get_short_content(SHORT_CONTENT_LENGTH)
+        if len(short) > SHORT_CONTENT_LENGTH:
+            return f"{short[:SHORT_CONTENT_LENGTH]}..."
+        return short
     short_content.short_description = 'Comment'
 
     actions = ['flag_comments', 'unflag_comments']
 
     def flag_comments(self, request, queryset):
         """Bulk flag comments for review"""
-        update = queryset.update(is_flagged=True)
+        updated = queryset.update(is_flagged=True)
         self.message_user(request, f'{updated} comment(s) flagged.', messages.WARNING)
     flag_comments.short_description = "🚩 Flag selected comments"
 
@@ -145,6 +249,7 @@ class VocabAdmin(admin.ModelAdmin):
         'language',
         'difficulty',
         'category',
+        TopContributorFilter,
         'created_at',
         ('reviewed_by', admin.EmptyFieldListFilter),  # Filter by reviewed/not reviewed
     ]
@@ -173,13 +278,18 @@ class VocabAdmin(admin.ModelAdmin):
     autocomplete_fields = ['tags']
 
     # Horizontal filter
-    filter_horizontal = ['tags', 'favorites']
+    filter_horizontal = ['tags']
+
+    # ID inputs for user relations (a select would load every User)
+    raw_id_fields = ['user', 'favorites']
 
     # Date drill-down navigation
     date_hierarchy = 'created_at'
 
-    # Pagination
+    # Pagination (estimated count avoids a full COUNT(*) on large tables)
     list_per_page = 25
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     # === FIELDSETS (Organize edit page) ===
     fieldsets = (
@@ -255,44 +365,27 @@ class VocabAdmin(admin.ModelAdmin):
 
     def language_badge(self, obj):
         """Color-coded language badge"""
-        colors = {
-            'kikuyu': '#b5cf6',  # Purple
-            'english': '#3b82f6',  # Blue
-            'swahili': '#10b981',  # Green
-        }
-        color = colors.get(obj.language, '#6b7280')
-        return format_html(
-            '<span style="background: {}; color: white; padding: 3px 8px; '
-            'border-radius: 4px; font-size: 11px; font-weight: 600; '
-            'text-transform: uppercase;">{}</span>',
-            color,
-            obj.get_language_display()
-        )
+        badge = LANGUAGE_BADGES.get(obj.language)
+        if badge is None:
+            badge = format_html(LANGUAGE_BADGE_TEMPLATE, DEFAULT_BADGE_COLOR, obj.get_language_display())
+        return badge
     language_badge.short_description = 'Language'
 
     def status_badge(self, obj):
         """Visual status indicator with emoji"""
-        badges = {
-            'pending': ('<span style="background: #f59e0b; color: white;">', '⏳ Pending'),
-            'approved': ('<span style="background: #10b981; color: white;">', '✅ Approved'),
-            'rejected': ('<span style="background: #ef4444; color: white;">', '❌ Rejected'),
-        }
-        badge_html, badge_text = badges.get(obj.status, ('<span>', obj.status))
-        return format_html(
-            '<span style="background: {}; color: white; padding: 4px 10px; '
-            'border-radius: 4px; font-size: 11px; font-weight: 600; '
-            'text-transform: uppercase;">{}</span>',
-            badge_html,
-            badge_text
-        )
+        badge = STATUS_BADGES.get(obj.status)
+        if badge is None:
+            badge = format_html(STATUS_BADGE_TEMPLATE, DEFAULT_BADGE_COLOR, obj.status)
+        return badge
     status_badge.short_description = 'Status'
 
     def media_preview(self, obj):
         """Quick preview of audio/image availability"""
         icons = []
-        if obj.audio:
+        # Check the stored name only; never touch the storage backend per row
+        if obj.audio.name:
             icons.append('🎵')
-        if obj.image:
+        if obj.image.name:
             icons.append('🖼️')
         return ' '.join(icons) if icons else '--'
     media_preview.short_description = 'Media'
@@ -312,7 +405,7 @@ class VocabAdmin(admin.ModelAdmin):
         return format_html(
             '<span style="color: #6b7280; font-size: 12px;">👁️{} | ❤️ {}</span>',
             obj.view_count,
-            obj.favorite_count()
+            obj._fav_count
         )
     stats_display.short_description = 'Stats'
 
@@ -342,8 +435,10 @@ class VocabAdmin(admin.ModelAdmin):
 
     def contributor_info(self, obj):
         """Detailed contributor Information"""
-        total_contributions = Vocab.objects.filter(user=obj.user).count()
-        approved = Vocab.objects.filter(user=obj.user, status='approved').count()
+        stats = Vocab.objects.filter(user=obj.user).aggregate(
+            total=Count('id'),
+            approved=Count('id', filter=Q(status='approved'))
+        )
 
         return format_html(
             '<div style="padding: 10px; background: #1e1e2e; border-radius: 6px; '
@@ -353,14 +448,16 @@ class VocabAdmin(admin.ModelAdmin):
             'Total: {} entries | Approved: {} entries'
             '</p></div>',
             obj.user.get_full_name() or obj.user.username,
-            total_contributions,
-            approved
+            stats['total'],
+            stats['approved']
         )
     contributor_info.short_description = 'Contributor Details'
 
     def favorite_count_display(self, obj):
         """Shows who favorited this word"""
-        count = obj.favorite_count()
+        count = getattr(obj, '_fav_count', None)
+        if count is None:
+            count = obj.favorite_count()
         if count == 0:
             return "No favorites yet"
         return f"{count} user(s) favorited this"
@@ -383,6 +480,8 @@ class VocabAdmin(admin.ModelAdmin):
             reviewed_by=request.user,
             reviewed_at=timezone.now()
         )
+        Category.refresh_word_counts()
+        transaction.on_commit(bump_content_version)  # queryset.update() skips Vocab.save()
         self.message_user(
             request,
             f'✅ Successfully approved {updated} entry/entries.',
@@ -400,6 +499,8 @@ class VocabAdmin(admin.ModelAdmin):
             reviewed_by=request.user,
             reviewed_at=timezone.now()
         )
+        Category.refresh_word_counts()
+        transaction.on_commit(bump_content_version)
         self.message_user(
             request,
             f'❌ Rejected {updated} entry/entries. Add rejection reasons in edit page.',
@@ -415,6 +516,8 @@ class VocabAdmin(admin.ModelAdmin):
             reviewed_at=None,
             rejection_reason=''
         )
+        Category.refresh_word_counts()
+        transaction.on_commit(bump_content_version)
         self.message_user(
             request,
             f'⏳ Marked {updated} entry/entries as pending review.',
@@ -424,11 +527,23 @@ class VocabAdmin(admin.ModelAdmin):
 
     def delete_selected_with_files(self, request, queryset):
         """Delete entries AND their associated files.
-        Better than default delete which might leave orphaned files"""
-        count = queryset.count()
-        for obj in queryset:
-            obj.delete()  # Triggers custom delete() method in model
-
+        Better than default delete which might leave orphaned files.
+        Rows go in one bulk DELETE; files are removed after commit."""
+        # Collect file paths up front (no full model instances needed)
+        file_names = [
+            name
+            for pair in queryset.values_list('audio', 'image')
+            for name in pair
+            if name
+        ]
+
+        with transaction.atomic():
+            _, deleted = queryset.delete()
+            transaction.on_commit(lambda: delete_stored_files(file_names))
+
+        count = deleted.get(Vocab._meta.label, 0)
+
+        transaction.on_commit(bump_content_version)  # Bulk delete skips Vocab.delete()
         self.message_user(
             request,
             f'🗑️ Deleted {count} entry/entries and associated files.',
@@ -436,15 +551,22 @@ class VocabAdmin(admin.ModelAdmin):
         )
     delete_selected_with_files.short_description = "🗑️ Delete selected(with files)"
 
+    def delete_queryset(self, request, queryset):
+        """Built-in "delete selected" action: bulk delete skips Vocab.delete()"""
+        super().delete_queryset(request, queryset)
+        transaction.on_commit(bump_content_version)
+
     # === SAVE OVERRIDE ===
 
     def save_model(self, request, obj, form, change):
         """Override save to automatically set reviewed_by when status changes."""
         if change:  # If editing existing object
-            original = Vocab.objects.get(pk=obj.pk)
+            original_status = Vocab.objects.filter(
+                pk=obj.pk
+            ).values_list('status', flat=True).first()
 
             # If Status changed and no reviewed_by set, set it to current user
-            if original.status != obj.status and not obj.reviewed_by:
+            if original_status != obj.status and not obj.reviewed_by:
                 obj.reviewed_by = request.user
                 obj.reviewed_at = timezone.now()
 
@@ -454,17 +576,34 @@ class VocabAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         """Optimize queries by pre-fetching related objects.
-        Prevents N+1 query problem (important for performance)."""
-        qs = super().get_queryset(request)
-        return qs.select_related(
+        Prevents N+1 query problem (important for performance).
+        The changelist only needs the joined columns, so it skips the
+        prefetches and defers the large text fields."""
+        qs = super().get_queryset(request).select_related(
             'user',
             'category',
             'reviewed_by'
-        ).prefetch_related(
+        ).annotate(
+            _fav_count=Count('favorites', distinct=True)
+        )
+
+        url_name = getattr(request.resolver_match, 'url_name', '')
+        if url_name == 'vocab_vocab_changelist':
+            return qs.defer(
+                'notes',
+                'example_sentence',
+                'example_translation',
+                'pronunciation_guide',
+                'rejection_reason'
+            )
+
+        return qs.prefetch_related(
             'tags',
-            'favorites',
+            # The raw-id widget only needs ids, not every favoriting user's row
+            Prefetch('favorites', queryset=User.objects.only('id')),
             'comments'
         )
+
 # =========================================
 # LEARNING PROGRESS ADMIN (Future Feature)
 # =========================================
@@ -474,7 +613,8 @@ class LearningProgressAdmin(admin.ModelAdmin):
     """Track user learning progress (Phase 2 feature).
     For now, just basic admin to see data."""
     list_display = ['user', 'vocab', 'mastery_level', 'times_reviewed', 'last_reviewed']
-    list_filter = ['mastery_level', 'user']
+    list_filter = ['mastery_level']
+    list_select_related = ['user', 'vocab']
     search_fields = ['user__username', 'vocab__word']
     readonly_fields = ['times_reviewed', 'last_reviewed', 'next_review']
 
@@ -0,0 +1,28 @@
+"""Shared cache keys for public vocab pages.
+Cached entries embed a content version; bumping it (on any Vocab or
+Category change) makes every older entry unreachable at once, for all
+workers only if they share the cache (see CACHES in settings)."""
+import time
+
+from django.core.cache import cache
+
+CONTENT_VERSION_KEY = 'vocab:content_version'
+
+def get_content_version():
+    """Current content version (created on first use).
+    Seeded from the clock so a lost key never reuses an old version."""
+    return cache.get_or_set(CONTENT_VERSION_KEY, lambda: int(time.time()), timeout=None)
+
+def bump_content_version():
+    """Invalidate cached public data after vocab/category changes.
+    Run it via transaction.on_commit(): bumped any earlier, a concurrent
+    request could cache pre-commit data under the new version."""
+    try:
+        cache.incr(CONTENT_VERSION_KEY)
+    except ValueError:
+        # Key missing (first run or evicted): a fresh clock-based version invalidates
+        cache.set(CONTENT_VERSION_KEY, int(time.time()), timeout=None)
+
+def versioned_key(name):
+    """Cache key tied to the current content version"""
+    return f'vocab:{name}:v{get_content_version()}'
@@ -1,7 +1,21 @@
 from django import forms
 from django.core.exceptions import ValidationError
 from .models import Vocab, Comment, Tag
-import os
+import re
+
+# A comma-separated tag: no surrounding whitespace, never empty
+TAG_RE = re.compile(r'[^,\s](?:[^,]*[^,\s])?')
+
+# Allowed upload extensions (tuples, so str.endswith can take them directly)
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.ogg', '.m4a')
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
+def parse_tag_names(tag_input):
+    """Lowercased, de-duplicated tag names from comma-separated input"""
+    # One regex pass: already stripped, empty entries never match
+    return list(dict.fromkeys(
+        match.group().lower() for match in TAG_RE.finditer(tag_input)
+    ))
 
 class VocabForm(forms.ModelForm):
     # Custom tag input (comma-separated)
@@ -104,9 +118,8 @@ class VocabForm(forms.ModelForm):
 
         # If editing existing entry, populate tags
         if self.instance.pk:
-            tags = self.instance.tags.all()
             self.fields['tag_input'].initial = ', '.join(
-                [tag.name for tag in tags]
+                self.instance.tags.values_list('name', flat=True)
             )
 
     def clean_audio(self):
@@ -119,11 +132,9 @@ class VocabForm(forms.ModelForm):
                 raise ValidationError('Audio file too large. Max size is 10mb.')
 
             # Check file extension
-            ext = os.path.splitext(audio.name)[1].lower()
-            valid_extensions = ['.mp3', '.wav', '.ogg', '.m4a']
-            if ext not in valid_extensions:
+            if not audio.name.lower().endswith(AUDIO_EXTENSIONS):
                 raise ValidationError(
-                    f'Invalid audio format. Allowed: {", ".join(valid_extensions)}'
+                    f'Invalid audio format. Allowed: {", ".join(AUDIO_EXTENSIONS)}'
                 )
         return audio
 
@@ -136,11 +147,9 @@ class VocabForm(forms.ModelForm):
                 raise ValidationError('Image file too large. Max size is 5mb')
 
             # Check file extension
-            ext = os.path.splitext(image.name)[1].lower()
-            valid_extensions = ['.jpg', '.jpeg', '.png', '.webp']
-            if ext not in valid_extensions:
+            if not image.name.lower().endswith(IMAGE_EXTENSIONS):
                 raise ValidationError(
-                    f'Invalid image format. Allowed: {", ".join(valid_extensions)}'
+                    f'Invalid image format. Allowed: {", ".join(IMAGE_EXTENSIONS)}'
                 )
         return image
 
@@ -162,22 +171,14 @@ class VocabForm(forms.ModelForm):
         instance = super().save(commit=commit)
 
         if commit:
-            # Clear existing tags
-            instance.tags.clear()
-
             # Process tag input
+            tag_ids = {}
             tag_input = self.cleaned_data.get('tag_input', '')
             if tag_input:
-                tag_names = [
-                    tag.strip().lower()
-                    for tag in tag_input.split(',')
-                    if tag.strip()
-                ]
-
-                for tag_name in tag_names:
-                    # Get or create tag
-                    tag, created = Tag.objects.get_or_create(name=tag_name)
-                    instance.tags.add(tag)
+                tag_ids = Tag.ids_for_names(parse_tag_names(tag_input))
+
+            # set() diffs against existing rows, so unchanged tags aren't deleted and re-inserted
+            instance.tags.set(tag_ids.values())
 
         return instance
 
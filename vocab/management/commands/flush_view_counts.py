@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from vocab.view_counts import flush_view_counts
+
+
+class Command(BaseCommand):
+    help = 'Write buffered vocab view counts from the cache to the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of words checked per cache round trip'
+        )
+
+    def handle(self, *args, **options):
+        flushed = flush_view_counts(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Flushed {flushed} view(s).'))
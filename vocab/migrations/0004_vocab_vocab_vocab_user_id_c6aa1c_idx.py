@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-15 06:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocab', '0003_category_learningprogress_alter_comment_options_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vocab',
+            index=models.Index(fields=['user', 'status'], name='vocab_vocab_user_id_c6aa1c_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.8 on 2026-10-15 06:40
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+SEARCH_INDEX = django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='vocab_search_vector_gin')
+
+
+def create_search_index(apps, schema_editor):
+    """GIN index + backfill, PostgreSQL only (SQLite has no tsvector support)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Vocab = apps.get_model('vocab', 'Vocab')
+    schema_editor.add_index(Vocab, SEARCH_INDEX)
+    Vocab.objects.using(schema_editor.connection.alias).update(search_vector=(
+        SearchVector('word', weight='A', config='simple') +
+        SearchVector('translation', weight='B', config='simple') +
+        SearchVector('example_sentence', weight='C', config='simple')
+    ))
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Vocab = apps.get_model('vocab', 'Vocab')
+    schema_editor.remove_index(Vocab, SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocab', '0004_vocab_vocab_vocab_user_id_c6aa1c_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vocab',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Full-text search data (PostgreSQL only, kept up to date on save)', null=True),
+        ),
+        # Kept out of the model state so SQLite table rebuilds never try to create it
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
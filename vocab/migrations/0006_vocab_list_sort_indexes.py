@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-15 06:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocab', '0005_vocab_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vocab',
+            index=models.Index(fields=['status', '-created_at'], name='vocab_approved_newest'),
+        ),
+        migrations.AddIndex(
+            model_name='vocab',
+            index=models.Index(fields=['status', '-view_count'], name='vocab_approved_popular'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.8 on 2026-10-15 06:44
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_word_counts(apps, schema_editor):
+    """Count approved words per category once; Vocab keeps them current after"""
+    Category = apps.get_model('vocab', 'Category')
+    Vocab = apps.get_model('vocab', 'Vocab')
+    db = schema_editor.connection.alias
+    approved = Vocab.objects.using(db).filter(
+        category=OuterRef('pk'), status='approved'
+    ).order_by().values('category').annotate(c=Count('*')).values('c')
+    Category.objects.using(db).update(word_count=Coalesce(Subquery(approved), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocab', '0006_vocab_list_sort_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='word_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False, help_text='Approved words in this category (kept up to date by Vocab)'),
+        ),
+        migrations.RunPython(backfill_word_counts, migrations.RunPython.noop),
+    ]
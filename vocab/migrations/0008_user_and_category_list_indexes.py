@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-15 06:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocab', '0007_category_word_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vocab',
+            index=models.Index(fields=['user', '-created_at'], name='vocab_user_newest'),
+        ),
+        migrations.AddIndex(
+            model_name='vocab',
+            index=models.Index(fields=['category', 'status', '-created_at'], name='vocab_category_newest'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.8 on 2026-10-15 06:50
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comment_counts(apps, schema_editor):
+    """Count existing comments once; Comment keeps the counter current after"""
+    Vocab = apps.get_model('vocab', 'Vocab')
+    Comment = apps.get_model('vocab', 'Comment')
+    db = schema_editor.connection.alias
+    comments = Comment.objects.using(db).filter(
+        vocab=OuterRef('pk')
+    ).order_by().values('vocab').annotate(c=Count('*')).values('c')
+    Vocab.objects.using(db).update(comment_count=Coalesce(Subquery(comments), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocab', '0008_user_and_category_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vocab',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of comments (kept up to date by Comment)'),
+        ),
+        migrations.RunPython(backfill_comment_counts, migrations.RunPython.noop),
+    ]
@@ -1,9 +1,14 @@
-from django.db import models
+from django.db import models, connections, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.core.validators import FileExtensionValidator
 from django.utils.text import slugify
-import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .caching import bump_content_version
 
 class Category(models.Model):
     name = models.CharField(
@@ -26,6 +31,12 @@ class Category(models.Model):
         blank=True,
         help_text="Emoji or icon for UI display"
     )
+    word_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        db_index=True,
+        help_text="Approved words in this category (kept up to date by Vocab)"
+    )
 
     class Meta:
         verbose_name_plural = "Categories"
@@ -34,13 +45,42 @@ class Category(models.Model):
     def __str__(self):
         return self.name
 
+    @staticmethod
+    def make_slug(name):
+        """Slug for a name; usable before bulk_create, which skips save()"""
+        return slugify(name)
+
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.name)
+            self.slug = self.make_slug(self.name)
         super().save(*args, **kwargs)
+        transaction.on_commit(bump_content_version, using=self._state.db)
+
+    def delete(self, *args, **kwargs):
+        super().delete(*args, **kwargs)
+        transaction.on_commit(bump_content_version, using=self._state.db)
 
     def get_word_count(self):
-        return self.vocab_entries.filter(status='approved').count()
+        return self.word_count
+
+    @classmethod
+    def refresh_word_counts(cls):
+        """Recount approved words for every category in one UPDATE.
+        For bulk changes (queryset.update()/delete()) that skip Vocab.save()."""
+        approved = Vocab.objects.filter(
+            category=OuterRef('pk'), status='approved'
+        ).order_by().values('category').annotate(c=Count('*')).values('c')
+        cls.objects.update(word_count=Coalesce(Subquery(approved), 0))
+
+    @classmethod
+    def adjust_word_count(cls, pk, delta):
+        """Atomically add delta to one category's word count"""
+        if pk is None:
+            return
+        categories = cls.objects.filter(pk=pk)
+        if delta < 0:
+            categories = categories.filter(word_count__gte=-delta)  # Never below zero
+        categories.update(word_count=F('word_count') + delta)
 
 class Tag(models.Model):
     name = models.CharField(
@@ -60,11 +100,82 @@ class Tag(models.Model):
     def __str__(self):
         return self.name
 
+    @staticmethod
+    def make_slug(name):
+        """Slug for a name; usable before bulk_create, which skips save()"""
+        return slugify(name)
+
+    @classmethod
+    def unique_slug(cls, name):
+        """make_slug() de-duplicated against existing tags ('c' next to 'c++'
+        becomes 'c-2'); names with no ASCII slug ('日本') fall back to 'tag'"""
+        base = cls.make_slug(name)[:45] or 'tag'
+        slug, n = base, 1
+        while cls.objects.filter(slug=slug).exists():
+            n += 1
+            slug = f'{base}-{n}'
+        return slug
+
+    @classmethod
+    def ids_for_names(cls, names):
+        """{name: id} for the given tag names, creating any that don't exist.
+        One SELECT, one INSERT for missing tags, one SELECT for their ids;
+        only names whose slug collides are created one at a time."""
+        tag_ids = dict(cls.objects.filter(name__in=names).values_list('name', 'id'))
+        missing = [name for name in names if name not in tag_ids]
+        if missing:
+            # bulk_create skips save(), so set slugs here. ignore_conflicts also
+            # swallows slug clashes, so whatever is still missing afterwards is
+            # retried below with a de-duplicated slug
+            cls.objects.bulk_create(
+                [cls(name=name, slug=cls.make_slug(name)) for name in missing if cls.make_slug(name)],
+                ignore_conflicts=True
+            )
+            tag_ids.update(cls.objects.filter(name__in=missing).values_list('name', 'id'))
+            for name in missing:
+                if name not in tag_ids:
+                    tag, _ = cls.objects.get_or_create(
+                        name=name, defaults={'slug': cls.unique_slug(name)}
+                    )
+                    tag_ids[name] = tag.id
+        return tag_ids
+
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.name)
+            self.slug = self.unique_slug(self.name)
         super().save(*args, **kwargs)
 
+# Full-text search uses the 'simple' config: no English stemming,
+# since most words are Kikuyu
+SEARCH_CONFIG = 'simple'
+SEARCH_FIELDS = frozenset({'word', 'translation', 'example_sentence'})
+
+# Counters only ever changed by atomic F() updates; a full save() must not
+# write back the (possibly stale) copy held in memory
+COUNTER_FIELDS = frozenset({'view_count', 'comment_count'})
+
+def vocab_search_vector():
+    """Weighted search vector expression (word > translation > example)"""
+    return (
+        SearchVector('word', weight='A', config=SEARCH_CONFIG) +
+        SearchVector('translation', weight='B', config=SEARCH_CONFIG) +
+        SearchVector('example_sentence', weight='C', config=SEARCH_CONFIG)
+    )
+
+# Parallel deletes matter for remote storage (S3 etc.): one round-trip per file
+FILE_DELETE_WORKERS = 16
+
+def delete_stored_files(names):
+    """Remove media files by storage name (missing files are ignored)"""
+    names = [name for name in names if name]
+    storage = Vocab._meta.get_field('audio').storage
+    if len(names) <= 1:
+        for name in names:
+            storage.delete(name)
+        return
+    with ThreadPoolExecutor(max_workers=min(FILE_DELETE_WORKERS, len(names))) as pool:
+        list(pool.map(storage.delete, names))  # list() re-raises worker errors
+
 class Vocab(models.Model):
     # Language choices
     LANGUAGE_CHOICES = [
@@ -216,6 +327,18 @@ class Vocab(models.Model):
         default=0,
         help_text="Number of times this word was viewed"
     )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of comments (kept up to date by Comment)"
+    )
+
+    # === Search ===
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text search data (PostgreSQL only, kept up to date on save)"
+    )
 
     # === Timestamps ===
     created_at = models.DateTimeField(
@@ -246,6 +369,14 @@ class Vocab(models.Model):
             models.Index(fields=['status', 'language']),
             models.Index(fields=['-created_at']),
             models.Index(fields=['word', 'translation']),
+            models.Index(fields=['user', 'status']),
+            # Public list: approved words, newest / most viewed first
+            models.Index(fields=['status', '-created_at'], name='vocab_approved_newest'),
+            models.Index(fields=['status', '-view_count'], name='vocab_approved_popular'),
+            # My Words (user's entries, newest first) and category browse
+            models.Index(fields=['user', '-created_at'], name='vocab_user_newest'),
+            models.Index(fields=['category', 'status', '-created_at'], name='vocab_category_newest'),
+            # GIN index on search_vector lives in migration 0005 (PostgreSQL only)
         ]
 
     def __str__(self):
@@ -253,36 +384,104 @@ class Vocab(models.Model):
     def get_absolute_url(self):
         return reverse('vocab-detail', kwargs={'pk': self.pk})
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored file names so save() can spot replaced files
+        without re-reading the row."""
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values))
+        if 'audio' in loaded and 'image' in loaded:
+            instance._stored_files = (loaded['audio'], loaded['image'])
+        if 'status' in loaded and 'category_id' in loaded:
+            instance._stored_listing = (loaded['status'], loaded['category_id'])
+        return instance
+
+    def _get_stored_files(self):
+        """Returns (audio, image) names as currently stored in the DB"""
+        if hasattr(self, '_stored_files'):
+            return self._stored_files
+        # Not loaded from the DB (or files deferred): fetch just the two paths
+        return Vocab.objects.filter(
+            pk=self.pk
+        ).values_list('audio', 'image').first() or (None, None)
+
+    def _get_stored_listing(self):
+        """Returns (status, category_id) as currently stored in the DB"""
+        if hasattr(self, '_stored_listing'):
+            return self._stored_listing
+        return Vocab.objects.filter(
+            pk=self.pk
+        ).values_list('status', 'category_id').first() or (None, None)
+
+    def _listed_category_id(self, listing):
+        """Category a (status, category_id) pair counts towards, if any"""
+        status, category_id = listing
+        return category_id if status == 'approved' else None
+
     def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            # Update every loaded field except the F()-maintained counters
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name not in COUNTER_FIELDS
+            ]
+
+        update_fields = kwargs.get('update_fields')
+        track_listing = update_fields is None or {'status', 'category', 'category_id'}.intersection(update_fields)
+        old_listing = self._get_stored_listing() if self.pk and track_listing else (None, None)
+
         # if updating and audio/image changed, delete old files
         if self.pk:
-            try:
-                old = Vocab.objects.get(pk=self.pk)
+            old_audio, old_image = self._get_stored_files()
 
-                # Delete old audio if new one uploaded
-                if old.audio and old.audio != self.audio:
-                    if os.path.isfile(old.audio.path):
-                        os.remove(old.audio.path)
+            # Delete old audio if new one uploaded
+            if old_audio and old_audio != self.audio.name:
+                self.audio.storage.delete(old_audio)
 
-                # Delete old image if new one uploaded
-                if old.image and old.image != self.image:
-                    if os.path.isfile(old.image.path):
-                        os.remove(old.image.path)
-            except Vocab.DoesNotExist:
-                pass
+            # Delete old image if new one uploaded
+            if old_image and old_image != self.image.name:
+                self.image.storage.delete(old_image)
 
         super().save(*args, **kwargs)
+        self._stored_files = (self.audio.name, self.image.name)
 
-    def delete(self, *args, **kwargs):
-        # Delete audio file
-        if self.audio and os.path.isfile(self.audio.path):
-            os.remove(self.audio.path)
+        if track_listing:
+            # Keep Category.word_count in step when a word enters/leaves/moves
+            new_listing = (self.status, self.category_id)
+            old_category = self._listed_category_id(old_listing)
+            new_category = self._listed_category_id(new_listing)
+            if old_category != new_category:
+                Category.adjust_word_count(old_category, -1)
+                Category.adjust_word_count(new_category, 1)
+            self._stored_listing = new_listing
 
-        # Delete image file
-        if self.image and os.path.isfile(self.image.path):
-            os.remove(self.image.path)
+        if update_fields is None or SEARCH_FIELDS.intersection(update_fields):
+            self.update_search_vector()
 
-        super().delete(*args, **kwargs)
+        transaction.on_commit(bump_content_version, using=self._state.db)
+
+    def update_search_vector(self):
+        """Refresh the stored search vector (no-op outside PostgreSQL)"""
+        if connections[self._state.db].vendor != 'postgresql':
+            return
+        Vocab.objects.filter(pk=self.pk).update(search_vector=vocab_search_vector())
+
+    def delete(self, *args, **kwargs):
+        # Audio/image files go only once the row delete has committed.
+        # Category.word_count is adjusted by a post_delete receiver (signals.py)
+        file_names = self._get_stored_files()
+
+        with transaction.atomic(using=self._state.db):
+            result = super().delete(*args, **kwargs)
+            transaction.on_commit(
+                lambda: delete_stored_files(file_names),
+                using=self._state.db
+            )
+        transaction.on_commit(bump_content_version, using=self._state.db)
+        return result
 
     # === Helper Methods ===
     def is_approved(self):
@@ -299,16 +498,22 @@ class Vocab(models.Model):
 
     def favorite_count(self):
         """Returns number of users who favorited this word"""
-        return self.comments.count()
+        return self.favorites.count()
 
-    def comment_count(self):
-        """Returns number of comments on this word"""
-        return self.comments.count()
+    @classmethod
+    def refresh_comment_counts(cls, pks):
+        """Recount comments for the given entries in one UPDATE.
+        For comments moved between entries."""
+        comments = Comment.objects.filter(
+            vocab=OuterRef('pk')
+        ).order_by().values('vocab').annotate(c=Count('*')).values('c')
+        cls.objects.filter(pk__in=pks).update(comment_count=Coalesce(Subquery(comments), 0))
 
     def increment_view_count(self):
-        """Increment view counter (call when word is viewed)"""
-        self.view_count += 1
-        self.save(update_fields=['view_count'])
+        """Increment view counter (call when word is viewed).
+        Atomic UPDATE in the DB, so concurrent views aren't lost."""
+        Vocab.objects.filter(pk=self.pk).update(view_count=F('view_count') + 1)
+        self.view_count += 1  # Keep the in-memory value in step for display
 
     def has_audio(self):
         """Check if audio file exists"""
@@ -363,6 +568,27 @@ class Comment(models.Model):
     def __str__(self):
         return f"Comment by {self.user.username} on {self.vocab.word}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored entry so save() can spot a moved comment"""
+        instance = super().from_db(db, field_names, values)
+        if 'vocab_id' in field_names:
+            instance._stored_vocab_id = values[field_names.index('vocab_id')]
+        return instance
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        old_vocab_id = getattr(self, '_stored_vocab_id', self.vocab_id)
+        with transaction.atomic(using=kwargs.get('using') or self._state.db):
+            super().save(*args, **kwargs)
+            if adding:
+                Vocab.objects.filter(pk=self.vocab_id).update(
+                    comment_count=F('comment_count') + 1
+                )
+            elif old_vocab_id != self.vocab_id:
+                Vocab.refresh_comment_counts([old_vocab_id, self.vocab_id])
+        self._stored_vocab_id = self.vocab_id
+
     def get_short_content(self, length=50):
         """Returns truncated comment content"""
         if len(self.content) > length:
@@ -0,0 +1,73 @@
+import hashlib
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from .caching import versioned_key
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that reads the planner's row estimate instead of COUNT(*).
+    Only used for unfiltered querysets on PostgreSQL/MySQL; small tables,
+    filtered lists and other backends fall back to the exact count."""
+    exact_count_threshold = 10000
+
+    def _estimated_count(self):
+        """Returns the planner's row estimate, or None if unavailable"""
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return None  # Not a queryset, or filtered (estimate would be wrong)
+
+        connection = connections[self.object_list.db]
+        table = self.object_list.model._meta.db_table
+        if connection.vendor == 'postgresql':
+            sql = "SELECT reltuples::bigint FROM pg_class WHERE relname = %s"
+        elif connection.vendor == 'mysql':
+            sql = (
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = %s"
+            )
+        else:
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [table])
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    @cached_property
+    def count(self):
+        estimate = self._estimated_count()
+        if estimate is None or estimate < self.exact_count_threshold:
+            return super().count
+        return estimate
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that caches COUNT(*) for a short time.
+    Keyed on the filtered SQL and the content version, so each search/filter
+    combination has its own entry and content changes invalidate them all."""
+    count_timeout = 30
+
+    def _cache_key(self):
+        """Cache key for this queryset's count, or None if not cacheable"""
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return None
+        try:
+            # Ordering and selected columns don't change the count
+            sql = str(self.object_list.order_by().values('pk').query)
+        except EmptyResultSet:
+            return None
+        digest = hashlib.md5(sql.encode()).hexdigest()
+        return versioned_key(f'count:{digest}')
+
+    @cached_property
+    def count(self):
+        key = self._cache_key()
+        if key is None:
+            return super().count
+        return cache.get_or_set(key, lambda: Paginator.count.func(self), self.count_timeout)
@@ -0,0 +1,42 @@
+"""Text search over approved vocab entries.
+On PostgreSQL this uses the stored, GIN-indexed search_vector; other
+backends (SQLite in development) fall back to icontains lookups."""
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import Q
+
+from .models import Vocab, SEARCH_CONFIG
+
+def full_text_enabled(queryset):
+    """True when the queryset's database supports full-text search"""
+    return connections[queryset.db].vendor == 'postgresql'
+
+def tag_ids(query):
+    """Ids of entries with a matching tag (straight off the through table)"""
+    return Vocab.tags.through.objects.filter(
+        tag__name__icontains=query
+    ).order_by().values('vocab_id')
+
+def search_vocab(queryset, query):
+    """Filter a Vocab queryset by a search string.
+    Content and tag matches are separate id queries UNIONed in SQL, so each
+    side can use its own index and the outer query needs no DISTINCT.
+    Full-text matches are annotated with a 'rank' for ordering."""
+    if full_text_enabled(queryset):
+        search_query = SearchQuery(query, config=SEARCH_CONFIG)
+        content_match = Q(search_vector=search_query)
+    else:
+        # No uppercase shadow columns here: only PostgreSQL wraps icontains in
+        # UPPER() and it takes the full-text path; '%q%' can't use a B-tree anyway
+        content_match = (
+            Q(word__icontains=query) |
+            Q(translation__icontains=query) |
+            Q(example_sentence__icontains=query)
+        )
+
+    content_ids = Vocab.objects.filter(content_match).order_by().values('pk')
+    queryset = queryset.filter(pk__in=content_ids.union(tag_ids(query)))
+
+    if full_text_enabled(queryset):
+        queryset = queryset.annotate(rank=SearchRank('search_vector', search_query))
+    return queryset
@@ -0,0 +1,24 @@
+"""Keep denormalized counters right on every delete path.
+post_delete also fires for cascades (e.g. deleting a User) and bulk
+queryset deletes, which never call Model.delete()."""
+from django.db.models import F
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import Vocab, Category, Comment
+
+@receiver(post_delete, sender=Vocab)
+def decrement_category_word_count(sender, instance, **kwargs):
+    """Drop a deleted approved entry from its category's word_count"""
+    # Counted by the stored listing, not unsaved in-memory edits
+    listing = getattr(instance, '_stored_listing', (instance.status, instance.category_id))
+    Category.adjust_word_count(instance._listed_category_id(listing), -1)
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, origin=None, **kwargs):
+    """Drop a deleted comment from its entry's comment_count"""
+    if getattr(origin, 'model', type(origin)) is Vocab:
+        return  # Cascading from its entry's delete: the row is gone anyway
+    Vocab.objects.filter(pk=instance.vocab_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1
+    )
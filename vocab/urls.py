@@ -4,7 +4,7 @@ from . import views
 urlpatterns = [
     # Public Browse
     path('', views.VocabListView.as_view(), name='vocab-list'),
-    path('search/', views.vocab_search, name='vocab-search'),
+    path('search/', views.VocabSearchView.as_view(), name='vocab-search'),
     path('category/<slug:slug>/', views.CategoryVocabListView.as_view(), name='vocab-category'),
 
     # Detail View
@@ -0,0 +1,62 @@
+"""Buffered view counting.
+Detail page hits increment a per-word counter in the cache; the
+flush_view_counts management command (run periodically, e.g. cron)
+writes the totals to the database in a few UPDATEs.
+Needs a cache shared by all workers (Redis/Memcached), so it's opt-in
+via the VOCAB_BUFFER_VIEW_COUNTS setting."""
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db.models import F
+
+from .models import Vocab
+
+KEY_PREFIX = 'vc'
+
+def _key(pk):
+    return f'{KEY_PREFIX}:{pk}'
+
+def record_view(pk):
+    """Add one view to the cache buffer for this word"""
+    key = _key(pk)
+    cache.add(key, 0, timeout=None)  # No-op if the counter already exists
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.set(key, 1, timeout=None)
+
+def flush_view_counts(batch_size=1000):
+    """Move buffered views into Vocab.view_count.
+    Returns the number of views written."""
+    total = 0
+    pks = Vocab.objects.order_by().values_list('pk', flat=True)
+    batch = []
+    for pk in pks.iterator(chunk_size=batch_size):
+        batch.append(pk)
+        if len(batch) == batch_size:
+            total += _flush_batch(batch)
+            batch = []
+    if batch:
+        total += _flush_batch(batch)
+    return total
+
+def _flush_batch(pks):
+    pending = cache.get_many([_key(pk) for pk in pks])
+
+    # Group words by how many views they gained (one UPDATE per distinct count)
+    by_count = defaultdict(list)
+    for key, count in pending.items():
+        if not count:
+            continue
+        # decr() instead of delete() keeps views recorded since get_many()
+        try:
+            cache.decr(key, count)
+        except ValueError:
+            pass  # Evicted meanwhile; still write what we read
+        by_count[count].append(int(key.split(':', 1)[1]))
+
+    for count, vocab_ids in by_count.items():
+        Vocab.objects.filter(pk__in=vocab_ids).update(view_count=F('view_count') + count)
+
+    return sum(count * len(vocab_ids) for count, vocab_ids in by_count.items())
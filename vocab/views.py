@@ -1,46 +1,120 @@
-from django.shortcuts import render, get_object_or_404, redirect
+from django.shortcuts import get_object_or_404, redirect
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
-from django.db.models import Q, Count, Prefetch
+from django.db.models import Q, Count, Prefetch, Exists, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.urls import reverse_lazy
 from django.http import JsonResponse
-from django.core.paginator import Paginator
+from django.template.loader import render_to_string
+from django.conf import settings
+from django.core.cache import cache
+from django.views.decorators.cache import cache_page
+from django.db import transaction
 
-from .models import Vocab, Category, Tag, Comment
+from .models import Vocab, Category, Comment
 from .forms import VocabForm, CommentForm
+from .view_counts import record_view
+from .caching import versioned_key
+from .paginators import CachedCountPaginator
+from .search import search_vocab
+
+Favorite = Vocab.favorites.through
+
+SIDEBAR_CACHE_TIMEOUT = 60  # seconds
+# Version bumps only reach other workers through a shared cache (REDIS_URL);
+# with the per-process default these timeouts bound how stale a page can be
+PAGE_CACHE_TIMEOUT = 30  # seconds
+RECENT_COMMENTS_LIMIT = 50  # comments shown on the detail page
+CATEGORY_CACHE_TIMEOUT = 60  # seconds
+
+# Columns rendered by the vocab cards in list templates
+LIST_CARD_FIELDS = (
+    'id', 'word', 'translation', 'language', 'difficulty', 'pronunciation_guide',
+    'audio', 'image', 'view_count', 'created_at',
+    'category__name', 'category__slug', 'category__icon',
+)
+
+# ==============
+# QUERY HELPERS
+# ==============
+
+def related_count(queryset, field='vocab_id'):
+    """Correlated COUNT subquery for annotating a Vocab queryset.
+    Unlike Count() it adds no JOIN, so several counts don't multiply rows."""
+    counts = queryset.filter(
+        **{field: OuterRef('pk')}
+    ).order_by().values(field).annotate(c=Count('*')).values('c')
+    return Coalesce(Subquery(counts), 0)
+
+def is_favorited_expression(user):
+    """EXISTS check for the user's favorite (False for anonymous).
+    One indexed probe per row instead of prefetching every favoriting user."""
+    if not user.is_authenticated:
+        return Value(False)
+    return Exists(Favorite.objects.filter(
+        vocab_id=OuterRef('pk'),
+        user_id=user.pk
+    ))
+
+def with_card_data(queryset, user):
+    """Everything the vocab cards render, in a fixed number of queries:
+    card columns only, category joined, tags prefetched, favorites counted
+    and flagged for the current user."""
+    return queryset.select_related(
+        'category',
+    ).prefetch_related(
+        'tags'
+    ).only(
+        # Only what the cards render (skips notes, examples, search_vector...)
+        *LIST_CARD_FIELDS
+    ).annotate(
+        fav_count=related_count(Favorite.objects.all()),
+        is_fav=is_favorited_expression(user),
+    )
+
+class AnonymousPageCacheMixin:
+    """Caches whole rendered pages for anonymous visitors.
+    The key prefix embeds the content version, so approving/editing any
+    word or category serves fresh pages right away (on every worker only
+    when the cache is shared)."""
+    page_cache_timeout = PAGE_CACHE_TIMEOUT
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            # Personalized nav/actions: always render
+            return super().dispatch(request, *args, **kwargs)
+        cached_dispatch = cache_page(
+            self.page_cache_timeout,
+            key_prefix=versioned_key('page')
+        )(super().dispatch)
+        return cached_dispatch(request, *args, **kwargs)
 
 # ==========================================
 # PUBLIC VIEWS (No Authentication Required)
 # ==========================================
 
-class VocabListView(ListView):
+class VocabListView(AnonymousPageCacheMixin, ListView):
     model = Vocab
     template_name = 'vocab/vocab_list.html'
     context_object_name = 'vocabs'
     paginate_by = 20
+    paginator_class = CachedCountPaginator
 
     def get_queryset(self):
         """Returns filtered and searched vocabulary entries.
         Only shows approved words to public."""
         # Base query: only approved words
-        queryset = Vocab.objects.filter(status='approved').select_related(
-            'category',
-            'user',
-        ).prefetch_related(
-            'tags'
+        queryset = with_card_data(
+            Vocab.objects.filter(status='approved'),
+            self.request.user
         ).order_by('-created_at')
 
         # SEARCH functionality
         search_query = self.request.GET.get('q', '').strip()
         if search_query:
-            queryset = queryset.filter(
-                Q(word__icontains=search_query) |
-                Q(translation__icontains=search_query) |
-                Q(example_sentence__icontains=search_query) |
-                Q(tags__name__icontains=search_query)
-            ).distinct()    # distinct() prevents duplicates from tags
+            queryset = search_vocab(queryset, search_query)
 
         # FILTER by category
         category_slug = self.request.GET.get('category')
@@ -58,7 +132,7 @@ class VocabListView(ListView):
             queryset = queryset.filter(language=language)
 
         # SORT options
-        sort = self.request.GET.get('sort', '-created_at')
+        sort = self.get_sort()
         if sort == 'popular':
             # Sort by view count
             queryset = queryset.order_by('-view_count')
@@ -66,37 +140,59 @@ class VocabListView(ListView):
             queryset =queryset.order_by('word')
         elif sort == 'oldest':
             queryset = queryset.order_by('created_at')
+        elif sort == 'relevance' and 'rank' in queryset.query.annotations:
+            # Full-text search: best matches first
+            queryset = queryset.order_by('-rank', '-created_at')
         else:
             # Default: newest first
-            queryset = queryset.order_by('created_at')
+            queryset = queryset.order_by('-created_at')
 
         return queryset
 
+    def get_default_sort(self):
+        """Searches rank by relevance; plain browsing shows newest first"""
+        return 'relevance' if self.request.GET.get('q', '').strip() else '-created_at'
+
+    def get_sort(self):
+        """Sort option for this request (links and the form always carry it,
+        so every page of a search uses the same ordering)"""
+        sort = self.request.GET.get('sort') or self.get_default_sort()
+        if sort == 'relevance' and not self.request.GET.get('q', '').strip():
+            return self.get_default_sort()  # Nothing to rank without a search
+        return sort
+
     def get_context_data(self, **kwargs):
         """Add extra data to template context."""
         context = super().get_context_data(**kwargs)
 
-        # Categories for filter dropdown
-        context['categories'] = Category.objects.annotate(
-            word_count=Count('vocab_entries', filter=Q(vocab_entries__status='approved'))
-        ).filter(word_count__gt=0)
+        # Categories for filter dropdown + statistics (same for every visitor, so cached)
+        context.update(cache.get_or_set(
+            versioned_key('sidebar'),
+            self.get_sidebar_data,
+            SIDEBAR_CACHE_TIMEOUT
+        ))
 
         # Preserve search/filter state
         context['search_query'] = self.request.GET.get('q', '')
         context['active_category'] = self.request.GET.get('category', '')
         context['active_difficulty'] = self.request.GET.get('difficulty', '')
         context['active_language'] = self.request.GET.get('language','')
-        context['active_sort'] = self.request.GET.get('sort','-created_at')
-
-        # Statistics
-        context['total_words'] = Vocab.objects.filter(status='approved').count()
-        context['total_categories'] = Category.objects.count()
+        context['active_sort'] = self.get_sort()
+        context['default_sort'] = self.get_default_sort()
 
         # Check if user is authenticated for "Add Word" button
         context['can_contribute'] = self.request.user.is_authenticated
 
         return context
 
+    def get_sidebar_data(self):
+        """Category filter options and site totals (cached by get_context_data)"""
+        return {
+            'categories': list(Category.objects.filter(word_count__gt=0)),
+            'total_words': Vocab.objects.filter(status='approved').count(),
+            'total_categories': Category.objects.count(),
+        }
+
 class VocabDetailView(DetailView):
     model = Vocab
     template_name = 'vocab/vocab_detail.html'
@@ -108,8 +204,14 @@ class VocabDetailView(DetailView):
             'user',
         ).prefetch_related(
             'tags',
-            'comments__user',
-            'favorites'
+            # Newest comments only, with just the columns the list renders
+            # (vocab_id stitches the prefetch back)
+            Prefetch('comments', queryset=Comment.objects.select_related('user').only(
+                'id', 'content', 'created_at', 'user__username', 'vocab_id'
+            ).order_by('-created_at')[:RECENT_COMMENTS_LIMIT], to_attr='recent_comments'),
+        ).annotate(
+            fav_count=related_count(Favorite.objects.all()),
+            is_favorited_flag=is_favorited_expression(self.request.user),
         )
 
         # If user is authenticated, let them see their own entries
@@ -129,7 +231,12 @@ class VocabDetailView(DetailView):
         # Check if already viewed in this session
         viewed_key = f'viewed_vocab_{obj.pk}'
         if not self.request.session.get(viewed_key, False):
-            obj.increment_view_count()
+            if settings.VOCAB_BUFFER_VIEW_COUNTS:
+                # Buffered in the cache, flushed by the flush_view_counts command
+                record_view(obj.pk)
+                obj.view_count += 1
+            else:
+                obj.increment_view_count()
             self.request.session[viewed_key] = True
         return obj
 
@@ -137,17 +244,12 @@ class VocabDetailView(DetailView):
         context = super().get_context_data(**kwargs)
         vocab = self.object
 
-        # Comments
-        context['comments'] = vocab.comments.all()
+        # Latest comments (prefetched); the heading shows the full comment_count
+        context['comments'] = vocab.recent_comments
         context['comment_form'] = CommentForm()
 
-        # Check if current user favorited this
-        if self.request.user.is_authenticated:
-            context['is_favorited'] = vocab.favorites.filter(
-                id=self.request.user.id
-            ).exists()
-        else:
-            context['is_favorited'] = False
+        # Check if current user favorited this (annotated in get_queryset)
+        context['is_favorited'] = vocab.is_favorited_flag
 
         # Related words (same category, excluding current)
         if vocab.category:
@@ -156,7 +258,7 @@ class VocabDetailView(DetailView):
                 status='approved'
             ).exclude(
                 pk=vocab.pk
-            ).select_related('category')[:6]  # Show 6 related words
+            ).only('id', 'word', 'translation')[:6]  # Show 6 related words
         else:
             context['related_words'] = []
 
@@ -196,18 +298,29 @@ class VocabCreateView(LoginRequiredMixin, CreateView):
         context['submit_text'] = 'Submit for Review'
         return context
 
-class VocabUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class OwnerRequiredMixin(UserPassesTestMixin):
+    """Only the original contributor passes.
+    The entry is fetched once: test_func() and get()/post() share it."""
+
+    def get_object(self, queryset=None):
+        if queryset is None and hasattr(self, '_object'):
+            return self._object
+        obj = super().get_object(queryset)
+        if queryset is None:
+            self._object = obj
+        return obj
+
+    def test_func(self):
+        """Check if current user owns this entry (ids only, no User query)"""
+        return self.get_object().user_id == self.request.user.pk
+
+class VocabUpdateView(LoginRequiredMixin, OwnerRequiredMixin, UpdateView):
     """Edit existing vocubulary entry.
     Only the original contributor can edit, Editing resets status to 'pending' ( needs re-approval)"""
     model = Vocab
     form_class = VocabForm
     template_name = 'vocab/vocab_form.html'
 
-    def test_func(self):
-        """Check if current user owns this entry"""
-        vocab = self.get_object()
-        return vocab.user == self.request.user
-
     def form_valid(self, form):
         """Reset status to pending when edited"""
         # If word was rejected and now edited, reset to pending
@@ -236,7 +349,7 @@ class VocabUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         context['is_edit'] = True
         return context
 
-class VocabDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+class VocabDeleteView(LoginRequiredMixin, OwnerRequiredMixin, DeleteView):
     """Delete vocubulary entry.
     Only the original contributor can delete, deletes associated files (audio, image)"""
 
@@ -244,17 +357,14 @@ class VocabDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     template_name = 'vocab/vocab_confirm_delete.html'
     success_url = reverse_lazy('vocab-list')
 
-    def test_func(self):
-        vocab = self.get_object()
-        return vocab.user == self.request.user
-
-    def delete(self, request, *args, **kwargs):
-        """Add success message on delete"""
+    def form_valid(self, form):
+        """Add success message on delete (DeleteView deletes in form_valid).
+        Vocab.delete() removes the audio/image files after commit."""
         messages.success(
             self.request,
             '🗑️ Word deleted successfully.'
         )
-        return super().delete(request, *args, **kwargs)
+        return super().form_valid(form)
 
 # =========================
 # SOCIAL FEATURES
@@ -264,24 +374,39 @@ class VocabDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
 def favorite_vocab(request, pk):
     """Toggle favorite on a vocubulary entry.
     AJAX-friendly"""
-    vocab = get_object_or_404(Vocab, pk=pk, status='approved')
-
-    # Toggle favorite
-    if request.user in vocab.favorites.all():
-        vocab.favorites.remove(request.user)
-        is_favorited = False
-        message = 'Removed to favorites'
-    else:
-        vocab.favorites.add(request.user)
-        is_favorited = True
-        message = 'Added to favorites'
+    with transaction.atomic():
+        # Lock the entry row first, so concurrent toggles on it run one at a time
+        vocab = get_object_or_404(
+            Vocab.objects.select_for_update().only('id'),
+            pk=pk,
+            status='approved'
+        )
+
+        # Toggle directly on the through table (ids only, no User/Vocab loading).
+        # The DELETE doubles as the membership probe: one indexed statement
+        # via the (vocab_id, user_id) unique index, never the full favorites set
+        removed, _ = Favorite.objects.filter(
+            vocab_id=vocab.pk,
+            user_id=request.user.pk
+        ).delete()
+        if removed:
+            is_favorited = False
+            message = 'Removed to favorites'
+        else:
+            Favorite.objects.create(vocab_id=vocab.pk, user_id=request.user.pk)
+            is_favorited = True
+            message = 'Added to favorites'
+
+        # Counted in its own statement once the lock is held: a subquery in the
+        # locking SELECT would use a snapshot from before any wait for the lock
+        favorite_count = Favorite.objects.filter(vocab_id=vocab.pk).count()
 
     # If AJAX request, return JSON
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
         return JsonResponse({
             'success': True,
             'is_favorited': is_favorited,
-            'favorite_count': vocab.favorite_count(),
+            'favorite_count': favorite_count,
             'message': message
         })
     # Otherwise redirect back
@@ -290,19 +415,35 @@ def favorite_vocab(request, pk):
 
 @login_required
 def add_comment(request, pk):
-    """Add a comment to a vocubulary entry."""
-    vocab = get_object_or_404(Vocab, pk=pk, status='approved')
+    """Add a comment to a vocubulary entry.
+    Comment.save() bumps the entry's comment_count in the same transaction."""
+    vocab = get_object_or_404(Vocab.objects.only('id'), pk=pk, status='approved')
+
+    is_ajax = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
 
     if request.method == 'POST':
+        form = CommentForm(request.POST)
         if form.is_valid():
             comment = form.save(commit=False)
             comment.vocab = vocab
             comment.user = request.user
             comment.save()
 
+            # If AJAX request, return just the new comment (no page re-render)
+            if is_ajax:
+                return JsonResponse({
+                    'success': True,
+                    'html': render_to_string('vocab/_comment.html', {'comment': comment}, request=request),
+                    'comment_count': Vocab.objects.filter(pk=vocab.pk).values_list(
+                        'comment_count', flat=True
+                    ).get(),
+                })
             messages.success(request, '💬 Comment added!')
 
         else:
+            if is_ajax:
+                errors = [error for field_errors in form.errors.values() for error in field_errors]
+                return JsonResponse({'success': False, 'errors': errors}, status=400)
             messages.error(request, '❌ Error adding comment.')
 
     return redirect('vocab-detail', pk=pk)
@@ -311,28 +452,35 @@ def add_comment(request, pk):
 # SEARCH & FILTER HELPERS
 # =========================
 
-def vocab_search(request):
-    query = request.GET.get('q', '').strip()
+class VocabSearchView(ListView):
+    """Paginated search over approved entries"""
+    model = Vocab
+    template_name = 'vocab/vocab_search_results.html'
+    context_object_name = 'vocabs'
+    paginate_by = 20
+    paginator_class = CachedCountPaginator
 
-    if not query:
-        return redirect('vocab-list')
+    def get(self, request, *args, **kwargs):
+        self.query = request.GET.get('q', '').strip()
+        if not self.query:
+            return redirect('vocab-list')
+        return super().get(request, *args, **kwargs)
 
-    # Search across multiple fields
-    results = Vocab.objects.filter(
-        Q(word__icontains=query) |
-        Q(translation__icontains=query) |
-        Q(example_sentence__icontains=query) |
-        Q(tags__name__icontains=query),
-        status='approved'
-    ).distinct().select_related('category', 'user')
+    def get_queryset(self):
+        # Full-text search on PostgreSQL (GIN-indexed search_vector), icontains elsewhere
+        results = with_card_data(search_vocab(
+            Vocab.objects.filter(status='approved'),
+            self.query
+        ), self.request.user)
 
-    context = {
-        'vocabs': results,
-        'search_query': query,
-        'result_count': results.count(),
-    }
+        if 'rank' in results.query.annotations:
+            return results.order_by('-rank', '-created_at')  # Best matches first
+        return results.order_by('-created_at')
 
-    return render(request, 'vocab/vocab_search_results.html', context)
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['search_query'] = self.query
+        return context
 
 # =========================================
 # USER DASHBOARD (Contributor's own words)
@@ -350,44 +498,70 @@ class MyVocabListView(LoginRequiredMixin, ListView):
         """Show only current user's entries"""
         return Vocab.objects.filter(
             user=self.request.user
-        ).select_related('category').order_by('-created_at')
+        ).select_related('category').only(
+            # Only what the My Words table renders
+            'id', 'word', 'translation', 'status', 'rejection_reason',
+            'view_count', 'created_at', 'category__name',
+        ).order_by('-created_at')
+
+    def get_stats(self):
+        """Per-status counts in one GROUP BY query (plain tuples, no model instances)"""
+        stats = {status: 0 for status, _ in Vocab.STATUS_CHOICES}
+        stats.update(
+            Vocab.objects.filter(user=self.request.user).order_by().values_list(
+                'status'
+            ).annotate(c=Count('*'))
+        )
+        stats['total'] = sum(stats.values())
+        return stats
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        """The stats total is the page count too: skip the paginator's COUNT(*)"""
+        paginator = super().get_paginator(queryset, per_page, **kwargs)
+        self.stats = self.get_stats()
+        paginator.count = self.stats['total']
+        return paginator
 
     def get_context_data(self, **kwargs):
         """Add Statistics about users's contributions"""
         context = super().get_context_data(**kwargs)
-        user_vocabs = Vocab.objects.filter(user=self.request.user)
-
-        context['stats'] = {
-            'total': user_vocabs.count(),
-            'pending': user_vocabs.filter(status='pending').count(),
-            'approved': user_vocabs.filter(status='approved').count(),
-            'rejected': user_vocabs.filter(status='rejected').count(),
-        }
-
+        context['stats'] = self.stats
         return context
 
 # ================
 # CATEGORY BROWSE
 # ================
 
-class CategoryVocabListView(ListView):
+class CategoryVocabListView(AnonymousPageCacheMixin, ListView):
     """Browse words by category"""
     model = Vocab
     template_name = 'vocab/category_vocab_list.html'
     context_object_name = 'vocabs'
     paginate_by = 20
 
+    def get_category(self):
+        """Category for the URL slug, cached (categories rarely change)"""
+        slug = self.kwargs['slug']
+        key = versioned_key(f'category:{slug}')
+        category = cache.get(key)
+        if category is None:
+            # Unknown slugs 404 without being cached
+            category = get_object_or_404(Category, slug=slug)
+            cache.set(key, category, CATEGORY_CACHE_TIMEOUT)
+        return category
+
     def get_queryset(self):
         """Filter by category slug"""
-        self.category = get_object_or_404(Category, slug=self.kwargs['slug'])
-        return Vocab.objects.filter(
+        self.category = self.get_category()
+        return with_card_data(Vocab.objects.filter(
             category=self.category,
             status='approved'
-        ).select_related('user').order_by('-created_at')
+        ), self.request.user).order_by('-created_at')
 
     def get_context_data(self, **kwargs):
         """Add category info"""
         context = super().get_context_data(**kwargs)
         context['category'] = self.category
-        context['word_count'] = self.get_queryset().count()
+        # Count already run by the paginator (no second query/category lookup)
+        context['word_count'] = context['paginator'].count
         return context